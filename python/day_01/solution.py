@@ -110,9 +110,29 @@ Using password method 0x434C49434B, what is the password to open the door?
 
 from __future__ import annotations
 
+import mmap
+import os
+import struct
+import sys
+
+from array import array
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
 from pathlib import Path
+from typing import BinaryIO
 
-DAY_DIR = Path(__file__).parent
+import numpy as np
+
+DAY_DIR: Path = Path(__file__).parent
+INPUTS: Path = DAY_DIR / "input.txt"
+
+# Binary rotations files start with a magic string, the format
+# version and the number of rotations, then hold the signed
+# distances as little-endian 64-bit integers
+BINARY_MAGIC: bytes = b"DIAL"
+BINARY_VERSION: int = 1
+BINARY_HEADER: struct.Struct = struct.Struct("<4sIQ")
 
 # ----- Part 1 ----- #
 
@@ -184,6 +204,51 @@ def solve_part1(starting_value: int, full_inputs: list[str]) -> int:
 # ----- Part 2 ----- #
 
 
+def turn_dial_part2(current_value: int, rotation: str) -> tuple[int, int]:
+    """
+    Takes in the rotation (one line instruction from the input) as well
+    as the current value of the dial, and returns the new value of the
+    dial after the rotation together with the number of clicks during
+    the rotation which left the dial pointing at 0.
+
+    Note
+    ----
+    Rather than doing every single click, the number of times we land on
+    0 is determined arithmetically. Turning right from position p by d
+    clicks, we land on 0 every time we go past a multiple of 100, which
+    happens (p + d) // 100 times. Turning left is the mirror image: from
+    position p it is as if we turned right from (100 - p) % 100, so we
+    land on 0 ((100 - p) % 100 + d) // 100 times. This naturally handles
+    starting on 0 (leaving it does not count) and rotations that wrap
+    around the dial many times.
+
+    Parameters
+    ----------
+    current_value : int
+        The current value of the dial.
+    rotation : str
+        The rotation instruction (e.g., "L68", "R30").
+
+    Returns
+    -------
+    tuple[int, int]
+        The new value of the dial after the rotation, and the number of
+        times the dial pointed at 0 during (and at the end of) it.
+    """
+    # The rotation is a letter (L or R) followed by a number
+    direction: str = rotation[0]
+    clicks: int = int(rotation[1:])
+
+    if direction == "L":
+        new_value = (current_value - clicks) % 100
+        zero_hits = ((100 - current_value) % 100 + clicks) // 100
+    else:  # it's R, trust aoc inputs
+        new_value = (current_value + clicks) % 100
+        zero_hits = (current_value + clicks) // 100
+
+    return new_value, zero_hits
+
+
 def solve_part2(starting_value: int, full_inputs: list[str]) -> int:
     """
     Solves part 2 of the puzzle. We take inputs one by one and turn
@@ -195,8 +260,9 @@ def solve_part2(starting_value: int, full_inputs: list[str]) -> int:
     It is important to note that ending on the value 0 does not count
     as passing through 0 during the rotation! Similarly, starting on 0
     and rotating away from it does not count as passing through 0! This
-    is handled by a more brute force solution of doing every single click
-    and checking if we **end up** on 0 after each click.
+    is handled in `turn_dial_part2`, which counts the landings on 0 in
+    a single computation per rotation instead of doing every click, so
+    that huge distances cost no more than small ones.
 
     Parameters
     ----------
@@ -213,34 +279,628 @@ def solve_part2(starting_value: int, full_inputs: list[str]) -> int:
 
     # Execute the rotations one by one
     for rotation in full_inputs:
-        # The rotation is a letter (L or R) followed by a number
-        direction: str = rotation[0]
-        clicks: int = int(rotation[1:])
-
-        # Execute the rotation: we do each click one by one and check
-        # after each if we end up on 0 (that's a pass if not the last)
-        # click, and ending on a 0 if the last click).
-        for _ in range(clicks):
-            if direction == "L":
-                dial_value = (dial_value - 1) % 100
-            else:  # it's R, trust aoc inputs
-                dial_value = (dial_value + 1) % 100
-
-            # Now we check if we're on a 0
-            if dial_value == 0:
-                zero_counter += 1
+        dial_value, zero_hits = turn_dial_part2(dial_value, rotation)
+        zero_counter += zero_hits
 
     return zero_counter
 
 
+# ----- Vectorized ----- #
+
+
+def parse_rotations(full_inputs: list[str]) -> np.ndarray:
+    """
+    Converts the rotation instructions into a single array of signed
+    distances: left rotations are negative and right rotations are
+    positive. For instance, ["L68", "R30"] becomes [-68, 30].
+
+    Note
+    ----
+    The conversion is done by rewriting the direction letters into a
+    sign and letting NumPy's text parser read the whole joined string
+    at once, so no Python object is created per rotation.
+
+    Parameters
+    ----------
+    full_inputs : list[str]
+        The list of rotation instructions.
+
+    Returns
+    -------
+    np.ndarray
+        The signed distances of each rotation, as 64-bit integers.
+    """
+    text: str = " ".join(full_inputs).replace("L", "-").replace("R", "")
+    return np.fromstring(text, dtype=np.int64, sep=" ")
+
+
+def solve_distances(starting_value: int, distances: np.ndarray) -> tuple[int, int]:
+    """
+    Solves both parts of the puzzle at once in a vectorized fashion,
+    from the signed distances of the rotations (as obtained from
+    `parse_rotations` or `map_binary`). All dial positions are found
+    from a cumulative sum of the distances (modulo 100), and the part
+    2 counts are derived from the same arrays with the formulas used
+    in `turn_dial_part2`.
+
+    Note
+    ----
+    The cumulative sum is done on the distances already reduced modulo
+    100, so that it can not overflow even for huge inputs with huge
+    distances: each term is then below 100.
+
+    Parameters
+    ----------
+    starting_value : int
+        The starting value of the dial.
+    distances : np.ndarray
+        The signed distances of the rotations, negative to the left.
+
+    Returns
+    -------
+    tuple[int, int]
+        The answers to part 1 and part 2, respectively.
+    """
+    # Position of the dial after each rotation, and before each rotation
+    steps: np.ndarray = distances % 100
+    positions: np.ndarray = (starting_value + np.cumsum(steps)) % 100
+    previous: np.ndarray = (positions - steps) % 100
+
+    # Part 1 is simply how many times we end a rotation on 0
+    part1: int = int(np.count_nonzero(positions == 0))
+
+    # Part 2: see turn_dial_part2 for the left / right formulas
+    clicks: np.ndarray = np.abs(distances)
+    offsets: np.ndarray = np.where(distances < 0, (100 - previous) % 100, previous)
+    part2: int = int(((offsets + clicks) // 100).sum())
+
+    return part1, part2
+
+
+def solve_vectorized(starting_value: int, full_inputs: list[str]) -> tuple[int, int]:
+    """
+    Solves both parts of the puzzle at once in a vectorized fashion.
+    The rotations are parsed into an array of signed distances in one
+    go, which is then handed to `solve_distances`.
+
+    Parameters
+    ----------
+    starting_value : int
+        The starting value of the dial.
+    full_inputs : list[str]
+        The list of rotation instructions.
+
+    Returns
+    -------
+    tuple[int, int]
+        The answers to part 1 and part 2, respectively.
+    """
+    return solve_distances(starting_value, parse_rotations(full_inputs))
+
+
+# ----- Streaming ----- #
+
+
+def stream_rotations(source: Path | None = None, chunk_size: int = 1 << 16) -> Iterator[str]:
+    """
+    Lazily reads rotation instructions from the given file, or from the
+    standard input if no file is given, and yields them one at a time.
+    The input is read in chunks of a fixed size so that only one chunk
+    is ever held in memory, no matter how large the stream is.
+
+    Note
+    ----
+    A chunk will most likely end in the middle of a line. This partial
+    line is kept aside and glued to the beginning of the next chunk.
+
+    Parameters
+    ----------
+    source : Path, optional
+        The file to read rotations from. Defaults to the standard input.
+    chunk_size : int
+        The number of characters to read at once. Defaults to 64k.
+
+    Yields
+    ------
+    str
+        The rotation instructions (e.g., "L68", "R30").
+    """
+    handle = sys.stdin if source is None else source.open()
+    leftover: str = ""
+
+    try:
+        while chunk := handle.read(chunk_size):
+            lines: list[str] = (leftover + chunk).split("\n")
+            leftover = lines.pop()  # possibly incomplete, wait for the next chunk
+            yield from (line.strip() for line in lines if line.strip())
+        if leftover.strip():
+            yield leftover.strip()
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def solve_streaming(starting_value: int, rotations: Iterable[str]) -> tuple[int, int]:
+    """
+    Solves both parts of the puzzle in a single pass over the rotation
+    instructions, which can be any iterable such as the generator from
+    `stream_rotations`. Only the dial value and the two counters are
+    kept around, so memory usage does not depend on the input size.
+
+    Parameters
+    ----------
+    starting_value : int
+        The starting value of the dial.
+    rotations : Iterable[str]
+        The rotation instructions.
+
+    Returns
+    -------
+    tuple[int, int]
+        The answers to part 1 and part 2, respectively.
+    """
+    dial_value: int = starting_value
+    zero_endings: int = 0
+    zero_hits: int = 0
+
+    for rotation in rotations:
+        dial_value, hits = turn_dial_part2(dial_value, rotation)
+        zero_hits += hits
+        if dial_value == 0:
+            zero_endings += 1
+
+    return zero_endings, zero_hits
+
+
+# ----- Parallel ----- #
+
+
+def summarize_rotations(distances: np.ndarray, dial_size: int = 100) -> tuple[int, np.ndarray, np.ndarray]:
+    """
+    Summarizes the effect of a sequence of rotations for every possible
+    starting position of the dial at once. The summary is made of the
+    total offset the rotations apply to the dial, and two tables (one
+    entry per dial position) giving, for each starting position, the
+    part 1 and part 2 zero counts over the sequence.
+
+    Note
+    ----
+    Ending a rotation on 0 happens, for each rotation, for exactly one
+    starting position, so the part 1 table is a histogram. For part 2
+    a rotation of d clicks always lands on 0 d // n times (with n the
+    dial size), plus once more for the starting positions from which
+    the remaining d % n clicks reach 0: these form a (circular) interval
+    of d % n values, which we accumulate with a difference array over
+    two dial turns.
+
+    Parameters
+    ----------
+    distances : np.ndarray
+        The signed distances of the rotations, negative to the left.
+    dial_size : int
+        The number of positions on the dial. Defaults to 100.
+
+    Returns
+    -------
+    tuple[int, np.ndarray, np.ndarray]
+        The offset applied to the dial by the rotations, then the part
+        1 and part 2 zero counts indexed by the starting position.
+    """
+    steps: np.ndarray = distances % dial_size
+
+    # Positions after and before each rotation when starting from 0
+    positions: np.ndarray = np.cumsum(steps) % dial_size
+    previous: np.ndarray = (positions - steps) % dial_size
+
+    # Part 1: starting from s, we end on 0 after a rotation if s + position is 0
+    part1: np.ndarray = np.bincount((-positions) % dial_size, minlength=dial_size)
+
+    # Part 2: full turns count for every start, remainders for an interval of starts
+    clicks: np.ndarray = np.abs(distances)
+    remainders: np.ndarray = clicks % dial_size
+    lower: np.ndarray = np.where(
+        distances < 0, (1 - previous) % dial_size, (dial_size - remainders - previous) % dial_size
+    )
+    difference: np.ndarray = np.bincount(lower, minlength=2 * dial_size) - np.bincount(
+        lower + remainders, minlength=2 * dial_size
+    )
+    covered: np.ndarray = np.cumsum(difference)
+    part2: np.ndarray = (clicks // dial_size).sum() + covered[:dial_size] + covered[dial_size:]
+
+    offset: int = int(steps.sum() % dial_size)
+    return offset, part1, part2
+
+
+def combine_summaries(
+    first: tuple[int, np.ndarray, np.ndarray], second: tuple[int, np.ndarray, np.ndarray]
+) -> tuple[int, np.ndarray, np.ndarray]:
+    """
+    Combines the summaries of two consecutive sequences of rotations
+    into the summary of their concatenation. Starting from position s,
+    the second sequence starts from position s + offset of the first,
+    so its tables are rolled by that offset before being added. Both
+    summaries must be for the same dial size.
+
+    Parameters
+    ----------
+    first : tuple[int, np.ndarray, np.ndarray]
+        The summary of the first sequence of rotations.
+    second : tuple[int, np.ndarray, np.ndarray]
+        The summary of the sequence of rotations following the first.
+
+    Returns
+    -------
+    tuple[int, np.ndarray, np.ndarray]
+        The summary of both sequences of rotations, in order.
+    """
+    first_offset, first_part1, first_part2 = first
+    second_offset, second_part1, second_part2 = second
+
+    offset: int = (first_offset + second_offset) % len(first_part1)
+    part1: np.ndarray = first_part1 + np.roll(second_part1, -first_offset)
+    part2: np.ndarray = first_part2 + np.roll(second_part2, -first_offset)
+    return offset, part1, part2
+
+
+def solve_parallel(
+    starting_value: int, full_inputs: list[str] | np.ndarray, max_workers: int | None = None
+) -> tuple[int, int]:
+    """
+    Solves both parts of the puzzle by splitting the rotations into
+    chunks, summarizing each of them for all starting positions in a
+    pool of worker processes, and combining the summaries in order.
+
+    Note
+    ----
+    The rotations are parsed once, and the workers are only sent
+    slices of the array of signed distances, which are much cheaper
+    to transfer than the rotation instructions themselves.
+
+    Parameters
+    ----------
+    starting_value : int
+        The starting value of the dial.
+    full_inputs : list[str] | np.ndarray
+        The list of rotation instructions, or their signed distances
+        (as given by `parse_rotations` or `map_binary`).
+    max_workers : int, optional
+        The number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    tuple[int, int]
+        The answers to part 1 and part 2, respectively.
+    """
+    distances: np.ndarray = (
+        full_inputs if isinstance(full_inputs, np.ndarray) else parse_rotations(full_inputs)
+    )
+    n_workers: int = max_workers or os.cpu_count() or 1
+    chunk_size: int = max(1, -(-len(distances) // n_workers))  # ceil division
+    chunks: list[np.ndarray] = [distances[i : i + chunk_size] for i in range(0, len(distances), chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        summaries = executor.map(summarize_rotations, chunks)
+        identity = summarize_rotations(np.empty(0, dtype=np.int64))
+        _, part1, part2 = reduce(combine_summaries, summaries, identity)
+
+    return int(part1[starting_value]), int(part2[starting_value])
+
+
+# ----- Binary Format ----- #
+
+
+def convert_to_binary(source: Path, destination: Path, batch_size: int = 1 << 16) -> int:
+    """
+    Converts a text file of rotation instructions into the compact
+    binary format: a small header followed by the signed distances
+    as packed 64-bit integers. The text file is streamed through and
+    written in batches, so it is never fully held in memory.
+
+    Note
+    ----
+    The number of rotations is only known at the end, so the header
+    is first written with a count of 0 and updated once we are done.
+    The distances are always written in little-endian order, swapping
+    their bytes first on big-endian platforms.
+
+    Parameters
+    ----------
+    source : Path
+        The text file with one rotation instruction per line.
+    destination : Path
+        The binary file to write.
+    batch_size : int
+        The number of rotations to write at once. Defaults to 64k.
+
+    Returns
+    -------
+    int
+        The number of rotations written.
+    """
+    count: int = 0
+    batch: array = array("q")
+
+    with destination.open("wb") as handle:
+        handle.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0))
+
+        for rotation in stream_rotations(source):
+            distance: int = int(rotation[1:])
+            batch.append(-distance if rotation[0] == "L" else distance)
+            if len(batch) == batch_size:
+                count += write_distances(handle, batch)
+                batch = array("q")
+
+        count += write_distances(handle, batch)
+
+        # Now that we know it, fill in the actual count in the header
+        handle.seek(0)
+        handle.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, count))
+
+    return count
+
+
+def write_distances(handle: BinaryIO, batch: array) -> int:
+    """
+    Writes a batch of signed distances to a binary rotations file, as
+    little-endian 64-bit integers whatever the platform's byte order.
+
+    Parameters
+    ----------
+    handle : BinaryIO
+        The binary rotations file, opened for writing.
+    batch : array
+        The signed distances to write. It is byte-swapped in place on
+        big-endian platforms.
+
+    Returns
+    -------
+    int
+        The number of distances written.
+    """
+    if sys.byteorder == "big":
+        batch.byteswap()
+    handle.write(batch.tobytes())
+    return len(batch)
+
+
+def read_binary_header(handle: BinaryIO) -> int:
+    """
+    Reads and checks the header of a binary rotations file, and returns
+    the number of rotations the file holds.
+
+    Parameters
+    ----------
+    handle : BinaryIO
+        The binary rotations file, opened for reading at its start.
+
+    Returns
+    -------
+    int
+        The number of rotations in the file.
+    """
+    header: bytes = handle.read(BINARY_HEADER.size)
+    if len(header) < BINARY_HEADER.size:
+        raise ValueError(f"Not a binary rotations file (truncated header): {handle.name}")
+
+    magic, version, count = BINARY_HEADER.unpack(header)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError(f"Not a binary rotations file (version {BINARY_VERSION}): {handle.name}")
+    return count
+
+
+def map_binary(path: Path) -> np.ndarray:
+    """
+    Memory-maps a binary rotations file as a read-only NumPy array of
+    the signed distances. No data is read or copied until it is used,
+    and the result can be given directly to `solve_distances`.
+
+    Parameters
+    ----------
+    path : Path
+        The binary rotations file, as written by `convert_to_binary`.
+
+    Returns
+    -------
+    np.ndarray
+        The signed distances of the rotations, negative to the left.
+    """
+    with path.open("rb") as handle:
+        count: int = read_binary_header(handle)
+
+    # An empty file can not be memory-mapped, but then there is nothing to map
+    if count == 0:
+        return np.empty(0, dtype="<i8")
+    return np.memmap(path, dtype="<i8", mode="r", offset=BINARY_HEADER.size, shape=(count,))
+
+
+def map_binary_view(path: Path) -> memoryview:
+    """
+    Memory-maps a binary rotations file as a read-only memoryview of
+    the signed distances, for use without NumPy. Indexing it gives
+    the distances as Python integers without any copy of the data.
+
+    Note
+    ----
+    A memoryview can only read integers in the host's byte order, so
+    this loader is only available on little-endian hosts (the order
+    of the file). Use `map_binary` on big-endian hosts.
+
+    Parameters
+    ----------
+    path : Path
+        The binary rotations file, as written by `convert_to_binary`.
+
+    Returns
+    -------
+    memoryview
+        The signed distances of the rotations, negative to the left.
+    """
+    if sys.byteorder != "little":
+        raise RuntimeError("map_binary_view requires a little-endian host, use map_binary instead")
+
+    with path.open("rb") as handle:
+        count: int = read_binary_header(handle)
+        if count == 0:
+            return memoryview(array("q"))
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return memoryview(mapped)[BINARY_HEADER.size : BINARY_HEADER.size + 8 * count].cast("q")
+
+
+# ----- Range Queries ----- #
+
+
+class DialHistory:
+    """
+    Index over the history of the dial through a list of rotations,
+    answering how many times the dial pointed at 0 between any two
+    rotations in constant time. It keeps, for every prefix of the
+    rotations, the dial position and the part 1 and part 2 zero
+    counts, so that the counts over rotations i to j (excluded) are
+    differences of two prefix values. New rotations can be appended
+    at any time, which only extends the prefixes.
+
+    Parameters
+    ----------
+    starting_value : int
+        The starting value of the dial.
+    full_inputs : Iterable[str], optional
+        The initial rotation instructions to index.
+    """
+
+    def __init__(self, starting_value: int, full_inputs: Iterable[str] = ()) -> None:
+        # Index i holds the state after the first i rotations
+        self.positions: list[int] = [starting_value]
+        self.prefix_endings: list[int] = [0]
+        self.prefix_hits: list[int] = [0]
+        self.extend(full_inputs)
+
+    def __len__(self) -> int:
+        """The number of indexed rotations."""
+        return len(self.positions) - 1
+
+    def append(self, rotation: str) -> None:
+        """
+        Appends a new rotation to the history, in constant time.
+
+        Parameters
+        ----------
+        rotation : str
+            The rotation instruction (e.g., "L68", "R30").
+        """
+        dial_value, hits = turn_dial_part2(self.positions[-1], rotation)
+        self.positions.append(dial_value)
+        self.prefix_endings.append(self.prefix_endings[-1] + (dial_value == 0))
+        self.prefix_hits.append(self.prefix_hits[-1] + hits)
+
+    def extend(self, rotations: Iterable[str]) -> None:
+        """
+        Appends new rotations to the history, in order.
+
+        Parameters
+        ----------
+        rotations : Iterable[str]
+            The rotation instructions.
+        """
+        for rotation in rotations:
+            self.append(rotation)
+
+    def position(self, index: int) -> int:
+        """
+        Gives the position of the dial after the first rotations.
+
+        Parameters
+        ----------
+        index : int
+            The number of rotations applied (0 for the starting value).
+
+        Returns
+        -------
+        int
+            The position of the dial after these rotations.
+        """
+        return self.positions[index]
+
+    def zero_endings(self, start: int, end: int) -> int:
+        """
+        Counts the rotations from start (included) to end (excluded)
+        which left the dial pointing at 0, as in part 1.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first rotation in the range.
+        end : int
+            The index of the rotation after the last one in the range.
+
+        Returns
+        -------
+        int
+            The number of times the dial ended a rotation on 0.
+        """
+        return self.prefix_endings[end] - self.prefix_endings[start]
+
+    def zero_hits(self, start: int, end: int) -> int:
+        """
+        Counts the clicks during the rotations from start (included) to
+        end (excluded) which left the dial pointing at 0, as in part 2.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first rotation in the range.
+        end : int
+            The index of the rotation after the last one in the range.
+
+        Returns
+        -------
+        int
+            The number of times the dial pointed at 0.
+        """
+        return self.prefix_hits[end] - self.prefix_hits[start]
+
+
+# ----- Sweeps ----- #
+
+
+def sweep_starting_values(full_inputs: list[str], dial_size: int = 100) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Solves both parts of the puzzle for every possible starting value
+    of the dial, in a single pass over the rotations. The dial can be
+    of any size, not only the 100 positions of the puzzle.
+
+    Note
+    ----
+    This is exactly the summary built by `summarize_rotations`, from
+    which we only keep the zero counts tables.
+
+    Parameters
+    ----------
+    full_inputs : list[str]
+        The list of rotation instructions.
+    dial_size : int
+        The number of positions on the dial. Defaults to 100.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The answers to part 1 and part 2, respectively, indexed by
+        the starting value of the dial.
+    """
+    _, part1, part2 = summarize_rotations(parse_rotations(full_inputs), dial_size)
+    return part1, part2
+
+
 # ----- Running ----- #
 
 if __name__ == "__main__":
-    inputs = (DAY_DIR / "input.txt").read_text().splitlines()
+    # Rotations are read from the file given as argument ("-" for the
+    # standard input), and by default from our own input file
+    source: Path | None = INPUTS
+    if len(sys.argv) > 1:
+        source = None if sys.argv[1] == "-" else Path(sys.argv[1])
 
     starting_value = 50  # given by the puzzle description
-    solution1 = solve_part1(starting_value, inputs)
+    solution1, solution2 = solve_streaming(starting_value, stream_rotations(source))
     print(f"Part 1 answer: {solution1}")
-
-    solution2 = solve_part2(starting_value, inputs)
     print(f"Part 2 answer: {solution2}")
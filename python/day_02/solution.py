@@ -70,12 +70,22 @@ What do you get if you add up all of the invalid IDs using these new rules?
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
 from pathlib import Path
+from typing import IO, AnyStr, NamedTuple
+
+import numpy as np
 
 DAY_DIR: Path = Path(__file__).parent
 INPUTS: Path = DAY_DIR / "input.txt"
 EXAMPLE: Path = DAY_DIR / "example.txt"
 
+# Saved invalid IDs tables are plain text, starting with this line
+TABLES_HEADER: str = "invalid-ids-tables v1"
+
 # ----- Common ----- #
 
 
@@ -102,6 +112,65 @@ def parse_ranges(input_text: str) -> list[tuple[int, int]]:
     return ranges
 
 
+def iter_ranges(source: IO[AnyStr], chunk_size: int = 1 << 20) -> Iterator[tuple[int, int]]:
+    """
+    Lazily parses the ranges from a file object (text or binary) or a
+    memory-mapped file, yielding them one at a time. The input is read
+    in chunks of a fixed size, so that memory usage stays flat even for
+    a huge single line of ranges.
+
+    Note
+    ----
+    A chunk will most likely end in the middle of a range. This partial
+    range is kept aside and glued to the beginning of the next chunk.
+
+    Parameters
+    ----------
+    source : IO[AnyStr]
+        The file object or mmap to read the ranges from.
+    chunk_size : int
+        The number of characters (or bytes) to read at once. Defaults to 1M.
+
+    Yields
+    ------
+    tuple[int, int]
+        The ranges, in the format (start, end).
+    """
+    leftover = None
+
+    while chunk := source.read(chunk_size):
+        comma, dash = (",", "-") if isinstance(chunk, str) else (b",", b"-")
+        parts = (chunk if leftover is None else leftover + chunk).split(comma)
+        leftover = parts.pop()  # possibly incomplete, wait for the next chunk
+
+        for part in parts:
+            start, end = part.split(dash)
+            yield int(start), int(end)  # int() ignores surrounding whitespace
+
+    if leftover is not None and leftover.strip():
+        start, end = leftover.split(dash)
+        yield int(start), int(end)
+
+
+def as_ranges(inputs: str | Iterable[tuple[int, int]]) -> Iterable[tuple[int, int]]:
+    """
+    Gives the ranges from the inputs given to the solving functions,
+    which can either be the input text or already parsed ranges (such
+    as the lazy ones from `iter_ranges`).
+
+    Parameters
+    ----------
+    inputs : str | Iterable[tuple[int, int]]
+        The input text containing the ranges, or the ranges themselves.
+
+    Returns
+    -------
+    Iterable[tuple[int, int]]
+        The ranges, in the format (start, end).
+    """
+    return parse_ranges(inputs) if isinstance(inputs, str) else inputs
+
+
 # ----- Part 1 ----- #
 
 
@@ -140,7 +209,7 @@ def is_invalid_id_part1(num: int) -> bool:
     return False
 
 
-def solve_part1(inputs: str) -> int:
+def solve_part1(inputs: str | Iterable[tuple[int, int]]) -> int:
     """
     Solves part 1 of the gift shop problem. We split the input into
     parsed ranges, then go through all numbers in each range and check
@@ -149,15 +218,15 @@ def solve_part1(inputs: str) -> int:
 
     Parameters
     ----------
-    inputs : str
-        The input text containing the ranges.
+    inputs : str | Iterable[tuple[int, int]]
+        The input text containing the ranges, or the ranges themselves.
 
     Returns
     -------
     int
         The sum of all invalid product IDs found in the ranges.
     """
-    ranges = parse_ranges(inputs)
+    ranges = as_ranges(inputs)
     invalid_id_sum = 0
 
     for start, end in ranges:
@@ -210,7 +279,7 @@ def is_invalid_id_part2(num: int) -> bool:
     return False
 
 
-def solve_part2(inputs: str) -> int:
+def solve_part2(inputs: str | Iterable[tuple[int, int]]) -> int:
     """
     Solves part 1 of the gift shop problem. We split the input into
     parsed ranges, then go through all numbers in each range and check
@@ -219,15 +288,15 @@ def solve_part2(inputs: str) -> int:
 
     Parameters
     ----------
-    inputs : str
-        The input text containing the ranges.
+    inputs : str | Iterable[tuple[int, int]]
+        The input text containing the ranges, or the ranges themselves.
 
     Returns
     -------
     int
         The sum of all invalid product IDs found in the ranges.
     """
-    ranges = parse_ranges(inputs)
+    ranges = as_ranges(inputs)
     invalid_id_sum = 0
 
     for start, end in ranges:
@@ -238,6 +307,772 @@ def solve_part2(inputs: str) -> int:
     return invalid_id_sum
 
 
+# ----- Arithmetic ----- #
+
+
+def repunit_multiplier(length: int, pattern_length: int) -> int:
+    """
+    Gives the number by which a pattern of digits must be multiplied to
+    be repeated until reaching the given length. For instance, for a
+    pattern of 2 digits repeated to a length of 6 this is 10101, and
+    indeed 12 * 10101 = 121212.
+
+    Parameters
+    ----------
+    length : int
+        The number of digits of the repeated number.
+    pattern_length : int
+        The number of digits of the pattern, must divide the length.
+
+    Returns
+    -------
+    int
+        The multiplier, (10^length - 1) / (10^pattern_length - 1).
+    """
+    return (10**length - 1) // (10**pattern_length - 1)
+
+
+def pattern_range(start: int, end: int, length: int, pattern_length: int) -> range:
+    """
+    Gives the patterns of the given length which, once repeated to the
+    given number of digits, fall within start and end (inclusive).
+
+    Note
+    ----
+    Patterns can't have leading zeros, so they are at least 10^(k-1)
+    for a pattern of k digits. Since a repeated number is the pattern
+    times the repunit multiplier, the bounds of the range translate to
+    bounds on the pattern by dividing by the multiplier.
+
+    Parameters
+    ----------
+    start : int
+        The start of the range, inclusive.
+    end : int
+        The end of the range, inclusive.
+    length : int
+        The number of digits of the repeated numbers.
+    pattern_length : int
+        The number of digits of the pattern, must divide the length.
+
+    Returns
+    -------
+    range
+        The valid patterns, possibly empty.
+    """
+    multiplier: int = repunit_multiplier(length, pattern_length)
+    lowest: int = max(10 ** (pattern_length - 1), -(-start // multiplier))  # ceil division
+    highest: int = min(10**pattern_length - 1, end // multiplier)
+    return range(lowest, highest + 1)
+
+
+def sum_repeated_in_range(start: int, end: int, length: int, pattern_length: int) -> int:
+    """
+    Sums all the numbers of the given length made of a pattern of the
+    given length repeated, which fall within start and end (inclusive).
+    No number is enumerated: these are pattern * multiplier with the
+    pattern in a range of consecutive integers, so their sum is the
+    multiplier times an arithmetic series.
+
+    Parameters
+    ----------
+    start : int
+        The start of the range, inclusive.
+    end : int
+        The end of the range, inclusive.
+    length : int
+        The number of digits of the repeated numbers.
+    pattern_length : int
+        The number of digits of the pattern, must divide the length.
+
+    Returns
+    -------
+    int
+        The sum of the matching numbers in the range.
+    """
+    patterns: range = pattern_range(start, end, length, pattern_length)
+    if not patterns:
+        return 0
+    lowest, highest = patterns[0], patterns[-1]
+    return repunit_multiplier(length, pattern_length) * (lowest + highest) * len(patterns) // 2
+
+
+def digit_lengths(start: int, end: int) -> range:
+    """
+    Gives the possible numbers of digits of the numbers within start
+    and end (inclusive).
+
+    Parameters
+    ----------
+    start : int
+        The start of the range, inclusive.
+    end : int
+        The end of the range, inclusive.
+
+    Returns
+    -------
+    range
+        The possible numbers of digits.
+    """
+    return range(len(str(start)), len(str(end)) + 1)
+
+
+def sum_invalid_ids_part1(start: int, end: int) -> int:
+    """
+    Sums the invalid IDs for part 1 within start and end (inclusive)
+    without going through the range: for each even number of digits,
+    these are the numbers made of a pattern of half that length which
+    is repeated twice.
+
+    Parameters
+    ----------
+    start : int
+        The start of the range, inclusive.
+    end : int
+        The end of the range, inclusive.
+
+    Returns
+    -------
+    int
+        The sum of all invalid product IDs in the range.
+    """
+    return sum(
+        sum_repeated_in_range(start, end, length, length // 2)
+        for length in digit_lengths(start, end)
+        if length % 2 == 0
+    )
+
+
+def generate_invalid_ids_part2(start: int, end: int) -> Iterator[int]:
+    """
+    Generates the invalid IDs for part 2 within start and end (inclusive)
+    directly, without testing every number of the range: for each number
+    of digits and each pattern length dividing it, these are the patterns
+    multiplied by the corresponding repunit multiplier.
+
+    Note
+    ----
+    A number such as 222222 is made of repeated patterns of 1, 2 and 3
+    digits, and would be built once for each. The IDs of a given length
+    are hence collected in a set before being yielded.
+
+    Parameters
+    ----------
+    start : int
+        The start of the range, inclusive.
+    end : int
+        The end of the range, inclusive.
+
+    Yields
+    ------
+    int
+        The invalid product IDs in the range, by increasing length.
+    """
+    for length in digit_lengths(start, end):
+        invalid_ids: set[int] = set()
+
+        for pattern_length in range(1, length // 2 + 1):
+            if length % pattern_length != 0:
+                continue
+            multiplier: int = repunit_multiplier(length, pattern_length)
+            patterns: range = pattern_range(start, end, length, pattern_length)
+            invalid_ids.update(pattern * multiplier for pattern in patterns)
+
+        yield from invalid_ids
+
+
+def mobius(n: int) -> int:
+    """
+    Computes the Möbius function of a positive integer: 0 if it has a
+    squared prime factor, otherwise (-1)^k with k its number of prime
+    factors.
+
+    Parameters
+    ----------
+    n : int
+        The positive integer.
+
+    Returns
+    -------
+    int
+        The value of the Möbius function, -1, 0 or 1.
+    """
+    result: int = 1
+    factor: int = 2
+
+    while factor * factor <= n:
+        if n % factor == 0:
+            n //= factor
+            if n % factor == 0:  # squared prime factor
+                return 0
+            result = -result
+        factor += 1
+
+    # What remains, if anything, is a last prime factor
+    return -result if n > 1 else result
+
+
+def part2_pattern_weights(length: int) -> list[tuple[int, int]]:
+    """
+    Gives the pattern lengths to consider, with their weights, so that
+    the invalid IDs for part 2 with the given number of digits are each
+    counted exactly once.
+
+    Note
+    ----
+    A number repeating a pattern of k digits also repeats patterns of
+    all multiples of k dividing its length (222222 repeats "2", "22"
+    and "222"). Denoting S(k) the numbers repeating a pattern of k
+    digits, and E(k) those whose shortest pattern has exactly k digits,
+    we have S(k) = sum of E(j) for j dividing k. By Möbius inversion,
+    E(L) = sum of μ(L / j) S(j) for j dividing L. The invalid IDs are
+    all those of S(L) (every L-digit number) except E(L), so their
+    total is the sum of -μ(L / j) S(j) over j dividing L, with j < L.
+
+    Parameters
+    ----------
+    length : int
+        The number of digits of the invalid IDs.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The pattern lengths and their (non-zero) weights.
+    """
+    weights: list[tuple[int, int]] = []
+    for pattern_length in range(1, length // 2 + 1):
+        if length % pattern_length == 0:
+            weight: int = -mobius(length // pattern_length)
+            if weight != 0:
+                weights.append((pattern_length, weight))
+    return weights
+
+
+def count_invalid_ids_part2(start: int, end: int) -> int:
+    """
+    Counts the invalid IDs for part 2 within start and end (inclusive),
+    without enumerating them, by inclusion-exclusion over the pattern
+    lengths (see `part2_pattern_weights`).
+
+    Parameters
+    ----------
+    start : int
+        The start of the range, inclusive.
+    end : int
+        The end of the range, inclusive.
+
+    Returns
+    -------
+    int
+        The number of invalid product IDs in the range.
+    """
+    return sum(
+        weight * len(pattern_range(start, end, length, pattern_length))
+        for length in digit_lengths(start, end)
+        for pattern_length, weight in part2_pattern_weights(length)
+    )
+
+
+def sum_invalid_ids_part2(start: int, end: int) -> int:
+    """
+    Sums the invalid IDs for part 2 within start and end (inclusive),
+    without enumerating them, by inclusion-exclusion over the pattern
+    lengths (see `part2_pattern_weights`). The cost only depends on
+    the number of digits of the bounds, not on the width of the range.
+
+    Parameters
+    ----------
+    start : int
+        The start of the range, inclusive.
+    end : int
+        The end of the range, inclusive.
+
+    Returns
+    -------
+    int
+        The sum of all invalid product IDs in the range.
+    """
+    return sum(
+        weight * sum_repeated_in_range(start, end, length, pattern_length)
+        for length in digit_lengths(start, end)
+        for pattern_length, weight in part2_pattern_weights(length)
+    )
+
+
+def solve_part1_arithmetic(inputs: str | Iterable[tuple[int, int]]) -> int:
+    """
+    Solves part 1 like `solve_part1`, but summing the invalid IDs of
+    each range with `sum_invalid_ids_part1` instead of checking every
+    number in the range.
+
+    Parameters
+    ----------
+    inputs : str | Iterable[tuple[int, int]]
+        The input text containing the ranges, or the ranges themselves.
+
+    Returns
+    -------
+    int
+        The sum of all invalid product IDs found in the ranges.
+    """
+    return sum(sum_invalid_ids_part1(start, end) for start, end in as_ranges(inputs))
+
+
+def solve_part2_arithmetic(inputs: str | Iterable[tuple[int, int]]) -> int:
+    """
+    Solves part 2 like `solve_part2`, but summing the invalid IDs of
+    each range with `sum_invalid_ids_part2` instead of checking every
+    number in the range.
+
+    Parameters
+    ----------
+    inputs : str | Iterable[tuple[int, int]]
+        The input text containing the ranges, or the ranges themselves.
+
+    Returns
+    -------
+    int
+        The sum of all invalid product IDs found in the ranges.
+    """
+    return sum(sum_invalid_ids_part2(start, end) for start, end in as_ranges(inputs))
+
+
+# ----- Precomputed Tables ----- #
+
+
+def build_invalid_ids_table(bound: int, part: int) -> tuple[list[int], list[int]]:
+    """
+    Builds the sorted table of all invalid IDs up to the given bound
+    (inclusive) for the given part of the puzzle, together with its
+    prefix sums: the i-th prefix sum is the sum of the first i IDs.
+
+    Parameters
+    ----------
+    bound : int
+        The highest ID to consider.
+    part : int
+        The part of the puzzle whose rules to use, 1 or 2.
+
+    Returns
+    -------
+    tuple[list[int], list[int]]
+        The sorted invalid IDs, and their prefix sums (one more entry
+        than there are IDs, starting with 0).
+    """
+    if part == 1:
+        invalid_ids: list[int] = [
+            pattern * repunit_multiplier(length, length // 2)
+            for length in digit_lengths(1, bound)
+            if length % 2 == 0
+            for pattern in pattern_range(1, bound, length, length // 2)
+        ]
+    else:
+        invalid_ids = sorted(generate_invalid_ids_part2(1, bound))
+    return invalid_ids, list(accumulate(invalid_ids, initial=0))
+
+
+class InvalidIdsTables(NamedTuple):
+    """
+    The precomputed invalid IDs tables of both parts (see
+    `build_invalid_ids_table`), with the bound they were built to.
+    """
+
+    bound: int
+    part1: tuple[list[int], list[int]]
+    part2: tuple[list[int], list[int]]
+
+
+def save_invalid_ids_tables(path: Path, bound: int) -> None:
+    """
+    Builds the invalid IDs tables of both parts up to the given bound
+    (see `build_invalid_ids_table`) and saves them to disk, so that
+    they only need to be computed once.
+
+    Note
+    ----
+    The tables are saved as plain text: a header line, a line with
+    the bound, then for each part a line with the part number and
+    the number of IDs, followed by one line per ID with the ID and
+    the prefix sum up to and including it.
+
+    Parameters
+    ----------
+    path : Path
+        The file to save the tables to.
+    bound : int
+        The highest ID to consider.
+    """
+    with path.open("w") as handle:
+        handle.write(f"{TABLES_HEADER}\nbound {bound}\n")
+        for part in (1, 2):
+            invalid_ids, prefix_sums = build_invalid_ids_table(bound, part)
+            handle.write(f"part {part} {len(invalid_ids)}\n")
+            handle.writelines(f"{num} {total}\n" for num, total in zip(invalid_ids, prefix_sums[1:]))
+
+
+def load_invalid_ids_tables(path: Path) -> InvalidIdsTables:
+    """
+    Loads invalid IDs tables previously saved with `save_invalid_ids_tables`.
+
+    Parameters
+    ----------
+    path : Path
+        The file the tables were saved to.
+
+    Returns
+    -------
+    InvalidIdsTables
+        The tables of both parts, and the bound they were built to.
+    """
+    with path.open() as handle:
+        header: str = handle.readline().rstrip("\n")
+        bound_line: list[str] = handle.readline().split()
+        if header != TABLES_HEADER or len(bound_line) != 2 or bound_line[0] != "bound":
+            raise ValueError(f"Not an invalid IDs tables file: {path}")
+
+        tables: list[tuple[list[int], list[int]]] = []
+        for part in (1, 2):
+            part_line: list[str] = handle.readline().split()
+            if part_line[:2] != ["part", str(part)] or len(part_line) != 3:
+                raise ValueError(f"Missing table for part {part} in {path}")
+
+            invalid_ids: list[int] = []
+            prefix_sums: list[int] = [0]
+            for _ in range(int(part_line[2])):
+                num, total = handle.readline().split()
+                invalid_ids.append(int(num))
+                prefix_sums.append(int(total))
+            tables.append((invalid_ids, prefix_sums))
+
+    return InvalidIdsTables(int(bound_line[1]), *tables)
+
+
+def query_invalid_ids_sum(table: tuple[list[int], list[int]], start: int, end: int) -> int:
+    """
+    Sums the invalid IDs within start and end (inclusive) from one of
+    the precomputed tables. The positions of the bounds in the sorted
+    IDs are found by bisection, and the sum is the difference of the
+    prefix sums at these positions.
+
+    Parameters
+    ----------
+    table : tuple[list[int], list[int]]
+        The sorted invalid IDs and their prefix sums.
+    start : int
+        The start of the range, inclusive.
+    end : int
+        The end of the range, inclusive.
+
+    Returns
+    -------
+    int
+        The sum of all invalid product IDs in the range.
+    """
+    invalid_ids, prefix_sums = table
+    return prefix_sums[bisect_right(invalid_ids, end)] - prefix_sums[bisect_left(invalid_ids, start)]
+
+
+def solve_batch(files: Iterable[Path], tables: InvalidIdsTables) -> list[tuple[int, int]]:
+    """
+    Solves both parts of the puzzle for each of the given input files,
+    answering every range from the precomputed tables.
+
+    Parameters
+    ----------
+    files : Iterable[Path]
+        The input files containing the ranges.
+    tables : InvalidIdsTables
+        The precomputed tables, as given by `load_invalid_ids_tables`.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The answers to part 1 and part 2 for each file, in order.
+    """
+    answers: list[tuple[int, int]] = []
+
+    for file in files:
+        ranges: list[tuple[int, int]] = parse_ranges(file.read_text())
+        if any(end > tables.bound for _, end in ranges):
+            raise ValueError(f"Ranges of {file} exceed the bound of the tables ({tables.bound})")
+
+        part1: int = sum(query_invalid_ids_sum(tables.part1, start, end) for start, end in ranges)
+        part2: int = sum(query_invalid_ids_sum(tables.part2, start, end) for start, end in ranges)
+        answers.append((part1, part2))
+
+    return answers
+
+
+# ----- Parallel ----- #
+
+
+def split_ranges(ranges: Iterable[tuple[int, int]], chunk_size: int) -> list[tuple[int, int]]:
+    """
+    Splits ranges into chunks of (at most) the given number of values,
+    so that wide and narrow ranges are turned into pieces of equal work.
+
+    Parameters
+    ----------
+    ranges : Iterable[tuple[int, int]]
+        The ranges to split, with inclusive bounds.
+    chunk_size : int
+        The maximum number of values in a chunk.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The chunks, as ranges with inclusive bounds.
+    """
+    return [
+        (chunk_start, min(chunk_start + chunk_size - 1, end))
+        for start, end in ranges
+        for chunk_start in range(start, end + 1, chunk_size)
+    ]
+
+
+def sum_invalid_ids_in_chunk(chunk: tuple[int, int], is_invalid: Callable[[int], bool]) -> int:
+    """
+    Sums the numbers of a chunk (inclusive bounds) for which the given
+    predicate holds, by checking every one of them.
+
+    Parameters
+    ----------
+    chunk : tuple[int, int]
+        The start and end of the chunk, inclusive.
+    is_invalid : Callable[[int], bool]
+        The predicate telling if a number is an invalid product ID.
+
+    Returns
+    -------
+    int
+        The sum of all invalid product IDs in the chunk.
+    """
+    start, end = chunk
+    return sum(num for num in range(start, end + 1) if is_invalid(num))
+
+
+def solve_parallel(
+    inputs: str | Iterable[tuple[int, int]],
+    is_invalid: Callable[[int], bool],
+    max_workers: int | None = None,
+    chunk_size: int = 10_000,
+) -> int:
+    """
+    Solves a part of the puzzle like `solve_part1` or `solve_part2`,
+    depending on the given predicate, but checking the numbers in a
+    pool of worker processes. The ranges are split into chunks of equal
+    size which are handed out one at a time to whichever worker is free,
+    so that no worker sits idle while another has a wide range to check.
+
+    Note
+    ----
+    The predicate is sent to the worker processes, so it must be defined
+    at the top level of a module (as `is_invalid_id_part1` and
+    `is_invalid_id_part2` are) for it to be picklable.
+
+    Parameters
+    ----------
+    inputs : str | Iterable[tuple[int, int]]
+        The input text containing the ranges, or the ranges themselves.
+    is_invalid : Callable[[int], bool]
+        The predicate telling if a number is an invalid product ID.
+    max_workers : int, optional
+        The number of worker processes. Defaults to the number of CPUs.
+    chunk_size : int
+        The maximum number of values checked in one go by a worker.
+
+    Returns
+    -------
+    int
+        The sum of all invalid product IDs found in the ranges.
+    """
+    chunks: list[tuple[int, int]] = split_ranges(as_ranges(inputs), chunk_size)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        partial_sums = executor.map(sum_invalid_ids_in_chunk, chunks, [is_invalid] * len(chunks))
+        return sum(partial_sums)
+
+
+# ----- Integer Predicates ----- #
+
+
+def count_digits(num: int) -> int:
+    """
+    Counts the digits of a positive integer without converting it to
+    a string, by comparing it to increasing powers of 10.
+
+    Parameters
+    ----------
+    num : int
+        The number whose digits to count.
+
+    Returns
+    -------
+    int
+        The number of digits (1 for 0).
+    """
+    length: int = 1
+    power: int = 10
+    while num >= power:
+        length += 1
+        power *= 10
+    return length
+
+
+def is_invalid_id_part1_int(num: int) -> bool:
+    """
+    Same as `is_invalid_id_part1`, with integer arithmetic only. A number
+    of 2k digits is a pattern of k digits repeated twice exactly when it
+    is a multiple of 10^k + 1 (e.g. 1212 = 12 * 101).
+
+    Note
+    ----
+    There is no need to check for a leading zero in the pattern: with
+    pattern < 10^(k-1), the product would have less than 2k digits.
+
+    Parameters
+    ----------
+    num : int
+        The number to check.
+
+    Returns
+    -------
+    bool
+        Wether the number is an invalid product ID.
+    """
+    length: int = count_digits(num)
+    return length % 2 == 0 and num % repunit_multiplier(length, length // 2) == 0
+
+
+def is_invalid_id_part2_int(num: int) -> bool:
+    """
+    Same as `is_invalid_id_part2`, with integer arithmetic only. A number
+    of L digits repeats a pattern of k digits exactly when it is a multiple
+    of the corresponding repunit multiplier (e.g. 121212 = 12 * 10101).
+
+    Parameters
+    ----------
+    num : int
+        The number to check.
+
+    Returns
+    -------
+    bool
+        Wether the number is an invalid product ID.
+    """
+    length: int = count_digits(num)
+    return any(
+        num % repunit_multiplier(length, pattern_length) == 0
+        for pattern_length in range(1, length // 2 + 1)
+        if length % pattern_length == 0
+    )
+
+
+# ----- Vectorized ----- #
+
+
+def classify_invalid_ids_part1(numbers: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of `is_invalid_id_part1_int`, telling for each of
+    the given numbers whether it is an invalid product ID for part 1.
+
+    Note
+    ----
+    The numbers are handled as 64-bit integers, so they must have at
+    most 18 digits for the powers of 10 to be representable.
+
+    Parameters
+    ----------
+    numbers : np.ndarray
+        The numbers to check.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean mask of the invalid product IDs among the numbers.
+    """
+    numbers = numbers.astype(np.int64, copy=False)
+    invalid: np.ndarray = np.zeros(numbers.shape, dtype=bool)
+    if numbers.size == 0:
+        return invalid
+
+    for length in digit_lengths(int(numbers.min()), int(numbers.max())):
+        if length % 2 == 0:
+            has_length: np.ndarray = (numbers >= 10 ** (length - 1)) & (numbers < 10**length)
+            invalid |= has_length & (numbers % repunit_multiplier(length, length // 2) == 0)
+
+    return invalid
+
+
+def classify_invalid_ids_part2(numbers: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of `is_invalid_id_part2_int`, telling for each of
+    the given numbers whether it is an invalid product ID for part 2.
+
+    Note
+    ----
+    The numbers are handled as 64-bit integers, so they must have at
+    most 18 digits for the powers of 10 to be representable.
+
+    Parameters
+    ----------
+    numbers : np.ndarray
+        The numbers to check.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean mask of the invalid product IDs among the numbers.
+    """
+    numbers = numbers.astype(np.int64, copy=False)
+    invalid: np.ndarray = np.zeros(numbers.shape, dtype=bool)
+    if numbers.size == 0:
+        return invalid
+
+    for length in digit_lengths(int(numbers.min()), int(numbers.max())):
+        has_length: np.ndarray = (numbers >= 10 ** (length - 1)) & (numbers < 10**length)
+        for pattern_length in range(1, length // 2 + 1):
+            if length % pattern_length == 0:
+                invalid |= has_length & (numbers % repunit_multiplier(length, pattern_length) == 0)
+
+    return invalid
+
+
+def solve_vectorized(
+    inputs: str | Iterable[tuple[int, int]],
+    classify: Callable[[np.ndarray], np.ndarray],
+    block_size: int = 1 << 20,
+) -> int:
+    """
+    Solves a part of the puzzle like `solve_part1` or `solve_part2`,
+    depending on the given classifier, but checking the numbers of
+    each range by whole blocks with NumPy instead of one at a time.
+
+    Parameters
+    ----------
+    inputs : str | Iterable[tuple[int, int]]
+        The input text containing the ranges, or the ranges themselves.
+    classify : Callable[[np.ndarray], np.ndarray]
+        The vectorized predicate giving the mask of invalid product IDs,
+        such as `classify_invalid_ids_part1` or `classify_invalid_ids_part2`.
+    block_size : int
+        The maximum number of values checked at once. Defaults to 2^20.
+
+    Returns
+    -------
+    int
+        The sum of all invalid product IDs found in the ranges.
+    """
+    invalid_id_sum: int = 0
+
+    for start, end in as_ranges(inputs):
+        for block_start in range(start, end + 1, block_size):
+            block: np.ndarray = np.arange(block_start, min(block_start + block_size, end + 1), dtype=np.int64)
+            invalid_id_sum += int(block[classify(block)].sum())
+
+    return invalid_id_sum
+
+
 # ----- Running ----- #
 
 if __name__ == "__main__":
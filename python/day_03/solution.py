@@ -69,8 +69,19 @@ What is the new total output joltage?
 
 from __future__ import annotations
 
+import mmap
+import os
+import random
+import timeit
+
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
 DAY_DIR: Path = Path(__file__).parent
 INPUTS: Path = DAY_DIR / "input.txt"
 EXAMPLE: Path = DAY_DIR / "example.txt"
@@ -83,9 +94,10 @@ def find_bank_joltage_part1(bank: str) -> int:
     """
     Provided with a bank of batteries as a string, finds the maximum
     joltage possiblly attainable by turning on two batteries. This is
-    done by going through all possible combinations of 2 batteries (still
-    preserving left-right order) and checking which produces the largest
-    number.
+    done in a single pass from the right end of the bank, keeping track
+    of the highest digit seen so far (the suffix maximum): the best pair
+    starting at a given battery is that battery followed by the highest
+    digit after it.
 
     Note
     ----
@@ -95,6 +107,38 @@ def find_bank_joltage_part1(bank: str) -> int:
     89. However there is the possibility to assemble 9 and a later 2 for
     a joltage of 92.
 
+    Parameters
+    ----------
+    bank : str
+        A string digits representing a bank of batteries.
+
+    Returns
+    -------
+    int
+        The maximum joltage possible by turning on two batteries.
+    """
+    max_joltage: int = 0
+    if len(bank) < 2:  # no pair of batteries to turn on
+        return max_joltage
+
+    suffix_max: int = ord(bank[-1]) - 48  # ord("0") is 48
+
+    # We go from the second to last battery back to the first one
+    for i in range(len(bank) - 2, -1, -1):
+        digit: int = ord(bank[i]) - 48
+        max_joltage = max(max_joltage, 10 * digit + suffix_max)
+        suffix_max = max(suffix_max, digit)
+
+    return max_joltage
+
+
+def find_bank_joltage_part1_pairs(bank: str) -> int:
+    """
+    Original (quadratic) version of `find_bank_joltage_part1`, kept as
+    a reference and for benchmarking. This goes through all possible
+    combinations of 2 batteries (still preserving left-right order) and
+    checks which produces the largest number.
+
     Parameters
     ----------
     bank : str
@@ -146,59 +190,54 @@ def solve_part1(inputs: list[str]) -> int:
 # ----- Part 2 ----- #
 
 
-def find_bank_joltage_part2(bank: str) -> int:
+def find_bank_joltage_part2(bank: str, batteries: int = 12) -> int:
     """
     Provided with a bank of batteries as a string, finds the maximum
-    joltage possiblly attainable by turning on TWELVE batteries while
-    preserving order.
+    joltage possiblly attainable by turning on TWELVE batteries (or any
+    other given number of batteries) while preserving order.
 
     Note
     ----
     Considering the length of the inputs (not the examples) doing a brute
-    force à la part 2 with 12 nested loops is not feasible. Instead, we use
-    a greedy algorithm by choosing the highest digit in a windowed selection:
-    for each of the 12 positions, we pick the largest digit available within
-    the window that still allows filling the remaining positions.
-
-    We're basically looking at a window of 12 digits, find the highest, then
-    start over from the next digit position until we've picked 12 digits.
+    force à la part 2 with 12 nested loops is not feasible. Instead, we
+    build the largest subsequence of the wanted length with a monotonic
+    stack, in a single pass over the bank: we may drop n - k digits, and
+    every time a digit is larger than the top of the stack, dropping the
+    top can only make the final number larger, so we do it as long as we
+    still may drop digits. The stack is kept in decreasing order, and its
+    first k digits are the answer.
 
     Parameters
     ----------
     bank : str
         A string digits representing a bank of batteries.
+    batteries : int
+        The number of batteries to turn on. Defaults to 12.
 
     Returns
     -------
     int
-        The maximum joltage possible by turning on twelve batteries.
+        The maximum joltage possible by turning on the batteries.
     """
-    result_digits: list[str] = []
-    remaining_digits: int = 12
-    n: int = len(bank)
-    start: int = 0
-
-    # For each slot we must pick one digit, and we do so 12 times
-    while remaining_digits > 0:
-        # We can pick from start to (n - remaining_digits) inclusive for this window
-        end: int = n - remaining_digits
+    if batteries > len(bank):
+        raise ValueError(f"Can not turn on {batteries} batteries in a bank of {len(bank)}")
 
-        # Now we find the position of the highest digit (and
-        # its value) in the window bank[start:end]
-        best_idx: int = start
-        for i in range(start, end + 1):
-            if bank[i] > bank[best_idx]:  # python strings compare lexicographically
-                best_idx = i  # current position of the highest digit in that window
+    stack: list[int] = []
+    droppable: int = len(bank) - batteries
 
-        # We've looked at the 12 digits in the window and noted the index
-        # of the highest. We store the digit value at that index and move
-        # our start position to one after that index for the next round.
-        result_digits.append(bank[best_idx])
-        start = best_idx + 1
-        remaining_digits -= 1
+    for char in bank:
+        digit: int = ord(char) - 48  # ord("0") is 48
+        # Drop smaller digits before this one while we still can
+        while droppable > 0 and stack and stack[-1] < digit:
+            stack.pop()
+            droppable -= 1
+        stack.append(digit)
 
-    # We only need to join the picked digits and convert to int
-    return int("".join(result_digits))
+    # Only the first digits are kept if we could not drop enough, build the number
+    joltage: int = 0
+    for digit in stack[:batteries]:
+        joltage = joltage * 10 + digit
+    return joltage
 
 
 def solve_part2(inputs: list[str]) -> int:
@@ -224,6 +263,433 @@ def solve_part2(inputs: list[str]) -> int:
     return total_joltage
 
 
+# ----- Vectorized ----- #
+
+
+def load_banks(inputs: list[str]) -> np.ndarray:
+    """
+    Loads banks of batteries of equal lengths into a 2D matrix of their
+    digits, one row per bank, in a single conversion.
+
+    Parameters
+    ----------
+    inputs : list[str]
+        The input lines representing banks of batteries.
+
+    Returns
+    -------
+    np.ndarray
+        The digits of the banks, as a (banks, batteries) uint8 matrix.
+    """
+    n_batteries: int = len(inputs[0])
+    if any(len(bank) != n_batteries for bank in inputs):
+        raise ValueError("All banks must have the same number of batteries")
+
+    digits: np.ndarray = np.frombuffer("".join(inputs).encode("ascii"), dtype=np.uint8) - ord("0")
+    return digits.reshape(len(inputs), n_batteries)
+
+
+def find_banks_joltages(banks: np.ndarray, batteries: int) -> np.ndarray:
+    """
+    Vectorized version of `find_bank_joltage_part2` for a matrix of banks
+    as given by `load_banks`: the greedy windowed selection is done for
+    all banks at once. For each battery to pick, the window ends at the
+    same column for all banks, but starts after the battery picked last
+    in each bank, so the columns before that are masked out before we
+    find the (leftmost) highest digit in each row.
+
+    Parameters
+    ----------
+    banks : np.ndarray
+        The digits of the banks, as a (banks, batteries) matrix.
+    batteries : int
+        The number of batteries to turn on in each bank.
+
+    Returns
+    -------
+    np.ndarray
+        The maximum joltage of each bank. These are 64-bit integers,
+        or Python integers if more than 18 batteries are turned on.
+    """
+    n_banks, n_columns = banks.shape
+    if batteries > n_columns:
+        raise ValueError(f"Can not turn on {batteries} batteries in banks of {n_columns}")
+
+    columns: np.ndarray = np.arange(n_columns)
+    rows: np.ndarray = np.arange(n_banks)
+    starts: np.ndarray = np.zeros(n_banks, dtype=np.int64)
+    joltages: np.ndarray = np.zeros(n_banks, dtype=np.int64 if batteries <= 18 else object)
+
+    for remaining in range(batteries, 0, -1):
+        end: int = n_columns - remaining  # last column of the window, inclusive
+        window: np.ndarray = np.where(
+            columns[: end + 1] >= starts[:, None], banks[:, : end + 1].astype(np.int8), -1
+        )
+        best: np.ndarray = window.argmax(axis=1)  # first occurrence, so leftmost
+        joltages = joltages * 10 + banks[rows, best]
+        starts = best + 1
+
+    return joltages
+
+
+def solve_batch(inputs: list[str], batteries: int) -> tuple[np.ndarray, int]:
+    """
+    Solves either part (depending on the number of batteries) for all
+    banks at once, which must all have the same number of batteries.
+
+    Parameters
+    ----------
+    inputs : list[str]
+        The input lines representing banks of batteries.
+    batteries : int
+        The number of batteries to turn on in each bank: 2 for part 1
+        and 12 for part 2.
+
+    Returns
+    -------
+    tuple[np.ndarray, int]
+        The maximum joltage of each bank, and the total output joltage.
+    """
+    joltages: np.ndarray = find_banks_joltages(load_banks(inputs), batteries)
+    return joltages, sum(joltages.tolist())  # Python ints, as int64 could overflow
+
+
+# ----- Range Maximum Queries ----- #
+
+
+class BankIndex:
+    """
+    Reusable index over a bank of batteries, answering the position of
+    the leftmost highest digit in any window of the bank in constant
+    time. This is a sparse table: for each power of two 2^j and each
+    position i, it stores the position of the leftmost highest digit
+    in the window of length 2^j starting at i. Any window is covered
+    by two (possibly overlapping) such windows.
+
+    With it, the greedy windowed selection of `find_bank_joltage_part2`
+    costs O(k) for k batteries, for any k, once the index is built in
+    O(n log n). Use `bank_index` to get cached indexes.
+
+    Parameters
+    ----------
+    bank : str
+        A string digits representing a bank of batteries.
+    """
+
+    def __init__(self, bank: str) -> None:
+        self.digits: list[int] = [ord(char) - 48 for char in bank]  # ord("0") is 48
+        self.table: list[list[int]] = [list(range(len(bank)))]
+
+        # Windows of length 2^j are made of two windows of length 2^(j-1)
+        width: int = 1
+        while 2 * width <= len(bank):
+            previous: list[int] = self.table[-1]
+            self.table.append(
+                [
+                    self._leftmost_max(previous[i], previous[i + width])
+                    for i in range(len(bank) - 2 * width + 1)
+                ]
+            )
+            width *= 2
+
+    def _leftmost_max(self, left: int, right: int) -> int:
+        """Gives whichever of two positions has the highest digit, the left one in case of a tie."""
+        return left if self.digits[left] >= self.digits[right] else right
+
+    def argmax(self, start: int, end: int) -> int:
+        """
+        Gives the position of the leftmost highest digit in the window
+        of the bank from start to end (inclusive).
+
+        Parameters
+        ----------
+        start : int
+            The first position of the window.
+        end : int
+            The last position of the window, inclusive.
+
+        Returns
+        -------
+        int
+            The position of the leftmost highest digit in the window.
+        """
+        level: int = (end - start + 1).bit_length() - 1
+        return self._leftmost_max(self.table[level][start], self.table[level][end - (1 << level) + 1])
+
+    def joltage(self, batteries: int) -> int:
+        """
+        Finds the maximum joltage possible by turning on the given number
+        of batteries, with the greedy windowed selection described in
+        `find_bank_joltage_part2`.
+
+        Parameters
+        ----------
+        batteries : int
+            The number of batteries to turn on.
+
+        Returns
+        -------
+        int
+            The maximum joltage possible by turning on the batteries.
+        """
+        if batteries > len(self.digits):
+            raise ValueError(f"Can not turn on {batteries} batteries in a bank of {len(self.digits)}")
+
+        joltage: int = 0
+        start: int = 0
+
+        for remaining in range(batteries, 0, -1):
+            best: int = self.argmax(start, len(self.digits) - remaining)
+            joltage = joltage * 10 + self.digits[best]
+            start = best + 1
+
+        return joltage
+
+
+@lru_cache(maxsize=1024)
+def bank_index(bank: str) -> BankIndex:
+    """
+    Gives the index of a bank of batteries, cached so that asking about
+    the same bank again (for another number of batteries for instance)
+    reuses the index already built.
+
+    Parameters
+    ----------
+    bank : str
+        A string digits representing a bank of batteries.
+
+    Returns
+    -------
+    BankIndex
+        The index over the bank.
+    """
+    return BankIndex(bank)
+
+
+# ----- Memory-Mapped ----- #
+
+
+def iter_banks(mapped: mmap.mmap, start: int = 0, end: int | None = None) -> Iterator[memoryview]:
+    """
+    Yields the banks of batteries of a memory-mapped input file, as views
+    on the ASCII bytes of each line. No line is ever copied: the views
+    point straight into the mapped file. Only part of the file can be
+    processed by giving byte offsets, which should be line boundaries.
+
+    Note
+    ----
+    The views must all be released before the mmap can be closed, so
+    they should not be kept around once processed.
+
+    Parameters
+    ----------
+    mapped : mmap.mmap
+        The memory-mapped input file.
+    start : int
+        The byte offset to start from. Defaults to the start of the file.
+    end : int, optional
+        The byte offset to stop at (excluded). Defaults to the end of the file.
+
+    Yields
+    ------
+    memoryview
+        The bytes of each bank of batteries.
+    """
+    end = len(mapped) if end is None else end
+
+    with memoryview(mapped) as view:
+        while start < end:
+            line_end: int = mapped.find(b"\n", start, end)
+            if line_end == -1:  # last line without a trailing newline
+                line_end = end
+            stop: int = line_end - 1 if line_end > start and view[line_end - 1] == 13 else line_end  # "\r"
+            if stop > start:
+                with view[start:stop] as bank:
+                    yield bank
+            start = line_end + 1
+
+
+def find_bank_joltage_bytes(bank: memoryview, batteries: int) -> int:
+    """
+    Same as `find_bank_joltage_part2`, for a bank given as ASCII bytes:
+    the digit values come directly from the byte codes.
+
+    Parameters
+    ----------
+    bank : memoryview
+        The ASCII bytes of the digits representing a bank of batteries.
+    batteries : int
+        The number of batteries to turn on.
+
+    Returns
+    -------
+    int
+        The maximum joltage possible by turning on the batteries.
+    """
+    if batteries > len(bank):
+        raise ValueError(f"Can not turn on {batteries} batteries in a bank of {len(bank)}")
+
+    stack: list[int] = []
+    droppable: int = len(bank) - batteries
+
+    for code in bank:
+        # Comparing the codes is the same as comparing the digits
+        while droppable > 0 and stack and stack[-1] < code:
+            stack.pop()
+            droppable -= 1
+        stack.append(code)
+
+    joltage: int = 0
+    for code in stack[:batteries]:
+        joltage = joltage * 10 + code - 48  # ord("0") is 48
+    return joltage
+
+
+def solve_mmap(path: Path, batteries: int, start: int = 0, end: int | None = None) -> int:
+    """
+    Solves either part (depending on the number of batteries) from an
+    input file which is memory-mapped and processed bank by bank from
+    its bytes, without creating a string for any line. Only part of the
+    file can be processed by giving byte offsets at line boundaries.
+
+    Parameters
+    ----------
+    path : Path
+        The input file, with one bank of batteries per line.
+    batteries : int
+        The number of batteries to turn on in each bank: 2 for part 1
+        and 12 for part 2.
+    start : int
+        The byte offset to start from. Defaults to the start of the file.
+    end : int, optional
+        The byte offset to stop at (excluded). Defaults to the end of the file.
+
+    Returns
+    -------
+    int
+        The total output joltage.
+    """
+    total_joltage: int = 0
+    if path.stat().st_size == 0:  # an empty file can not be memory-mapped
+        return total_joltage
+
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        # The generator is closed first, so its views are released before the mmap is
+        with closing(iter_banks(mapped, start, end)) as banks:
+            for bank in banks:
+                total_joltage += find_bank_joltage_bytes(bank, batteries)
+
+    return total_joltage
+
+
+# ----- Parallel ----- #
+
+
+def partition_file(path: Path, n_parts: int) -> list[tuple[int, int]]:
+    """
+    Splits a file into (at most) the given number of byte ranges of
+    about equal sizes, each starting and ending at a line boundary.
+
+    Note
+    ----
+    The file is cut at equally spaced offsets, and each cut is moved
+    forward to just after the next newline so that no line is split.
+    Only a few bytes around each cut are read to do so.
+
+    Parameters
+    ----------
+    path : Path
+        The file to split.
+    n_parts : int
+        The number of byte ranges wanted.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The byte ranges, as (start, end) offsets with the end excluded.
+    """
+    size: int = path.stat().st_size
+    boundaries: list[int] = [0]
+
+    with path.open("rb") as handle:
+        for part in range(1, n_parts):
+            offset: int = max(boundaries[-1], size * part // n_parts)
+            handle.seek(offset)
+            handle.readline()  # move to the end of the line we landed in
+            boundaries.append(min(handle.tell(), size))
+
+    boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def solve_parallel(path: Path, batteries: int, max_workers: int | None = None) -> int:
+    """
+    Solves either part (depending on the number of batteries) with a pool
+    of worker processes. The file is split into byte ranges at line
+    boundaries, and each worker maps the file and solves its own range
+    with `solve_mmap`: only the path and offsets are sent to workers, and
+    only their partial totals come back to be summed.
+
+    Parameters
+    ----------
+    path : Path
+        The input file, with one bank of batteries per line.
+    batteries : int
+        The number of batteries to turn on in each bank: 2 for part 1
+        and 12 for part 2.
+    max_workers : int, optional
+        The number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    int
+        The total output joltage.
+    """
+    n_workers: int = max_workers or os.cpu_count() or 1
+    byte_ranges: list[tuple[int, int]] = partition_file(path, n_workers)
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        partial_totals = executor.map(
+            solve_mmap,
+            [path] * len(byte_ranges),
+            [batteries] * len(byte_ranges),
+            [start for start, _ in byte_ranges],
+            [end for _, end in byte_ranges],
+        )
+        return sum(partial_totals)
+
+
+# ----- Benchmarking ----- #
+
+
+def benchmark_part1(bank_length: int = 2_000, number: int = 5) -> dict[str, float]:
+    """
+    Times `find_bank_joltage_part1` against the original pairwise
+    version, `find_bank_joltage_part1_pairs`, on a random bank of the
+    given length. Both are checked to agree before being timed.
+
+    Parameters
+    ----------
+    bank_length : int
+        The number of batteries in the random bank. Defaults to 2000.
+    number : int
+        The number of calls to time for each version. Defaults to 5.
+
+    Returns
+    -------
+    dict[str, float]
+        The average time per call, in seconds, of each version.
+    """
+    bank: str = "".join(random.choices("123456789", k=bank_length))
+    if find_bank_joltage_part1(bank) != find_bank_joltage_part1_pairs(bank):
+        raise RuntimeError("The two versions of find_bank_joltage_part1 disagree")
+
+    timings: dict[str, float] = {}
+    for function in (find_bank_joltage_part1, find_bank_joltage_part1_pairs):
+        timings[function.__name__] = timeit.timeit(lambda: function(bank), number=number) / number
+    return timings
+
+
 # ----- Running ----- #
 
 if __name__ == "__main__":
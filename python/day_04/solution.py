@@ -186,31 +186,39 @@ How many rolls of paper in total can be removed by the Elves and their forklifts
 
 from __future__ import annotations
 
+import mmap
+import os
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
 from pprint import pprint  # noqa: F401
 
+import numpy as np
+
 DAY_DIR: Path = Path(__file__).parent
 INPUTS: Path = DAY_DIR / "input.txt"
 EXAMPLE: Path = DAY_DIR / "example.txt"
 
 
-# ----- Part 1 ----- #
+# ----- Common ----- #
 
 
-def solve_part1(inputs: list[str]) -> int:
+class Grid:
     """
-    Solves part 1. Determines from the complete input
-    how many rolls of paper can be accessed by a forklift.
-    This is done by going over each position in the grid
-    and checking for the eight adjacent positions while
-    coubting the number of rolls of paper (@) found.
+    Grid of paper rolls which keeps the number of adjacent
+    paper rolls of every position up to date as rolls are
+    added or removed, so that checking if a roll can be
+    accessed by a forklift never requires a recount. Both
+    the rolls and the counts are stored as one byte per
+    position, row after row.
 
     Note
     ----
     We denote i the index along the vertical axis (rows)
     and j the index along the horizontal axis (columns).
-    Inspecting for a position at indices (i, j) requires
-    checking the following relative positions:
+    The positions adjacent to (i, j) are the following:
         - (i-1, j-1) : top left
         - (i-1, j)   : top
         - (i-1, j+1) : top right
@@ -221,8 +229,178 @@ def solve_part1(inputs: list[str]) -> int:
         - (i+1, j+1) : bottom right
 
     If any of these positions are out of bounds, then they
-    are simply ignored. Naturally, a position is not checked
-    if it does not contain a roll of paper (@).
+    are simply ignored.
+
+    Parameters
+    ----------
+    n_rows : int
+        The number of rows of the grid.
+    n_cols : int
+        The number of columns of the grid.
+    """
+
+    __slots__ = ("n_rows", "n_cols", "rolls", "counts")
+
+    def __init__(self, n_rows: int, n_cols: int) -> None:
+        self.n_rows: int = n_rows
+        self.n_cols: int = n_cols
+        self.rolls: bytearray = bytearray(n_rows * n_cols)  # 1 for a paper roll
+        self.counts: bytearray = bytearray(n_rows * n_cols)  # adjacent paper rolls
+
+    @classmethod
+    def from_lines(cls, inputs: list[str]) -> Grid:
+        """
+        Builds the grid from the input lines.
+
+        Parameters
+        ----------
+        inputs : list[str]
+            The input lines representing the grid.
+
+        Returns
+        -------
+        Grid
+            The grid of paper rolls, with its neighbour counts.
+        """
+        n_rows: int = len(inputs)
+        n_cols: int = len(inputs[0])
+        grid = cls(n_rows, n_cols)
+
+        # Counts are built in a single pass over the rows: first the sum of
+        # each position and its left and right neighbours in its own row,
+        # then the sum of these over the row above, the row itself and the
+        # row below, minus the position itself.
+        rows: list[bytes] = [bytes(char == "@" for char in line) for line in inputs]
+        empty: list[int] = [0] * n_cols
+        horizontal: list[list[int]] = [empty]
+        for row in rows:
+            padded: bytes = b"\x00" + row + b"\x00"
+            horizontal.append([a + b + c for a, b, c in zip(padded, padded[1:], padded[2:])])
+        horizontal.append(empty)
+
+        counts: list[int] = []
+        for i, row in enumerate(rows, start=1):
+            above, middle, below = horizontal[i - 1], horizontal[i], horizontal[i + 1]
+            counts.extend([a + b + c - r for a, b, c, r in zip(above, middle, below, row)])
+
+        grid.rolls[:] = b"".join(rows)
+        grid.counts[:] = bytes(counts)
+        return grid
+
+    def _update_neighbours(self, i: int, j: int, change: int) -> list[tuple[int, int]]:
+        """
+        Adds the change to the neighbour counts of all positions
+        adjacent to (i, j). This is the only place where counts
+        are updated, so it is kept tight with local variables.
+
+        Parameters
+        ----------
+        i : int
+            The row of the position.
+        j : int
+            The column of the position.
+        change : int
+            The change to the counts, 1 or -1.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The adjacent paper rolls whose count just went from
+            4 to 3, which have just become accessible.
+        """
+        n_cols: int = self.n_cols
+        rolls: bytearray = self.rolls
+        counts: bytearray = self.counts
+        exposed: list[tuple[int, int]] = []
+
+        for ni in range(max(i - 1, 0), min(i + 2, self.n_rows)):
+            for nj in range(max(j - 1, 0), min(j + 2, n_cols)):
+                if ni == i and nj == j:
+                    continue
+                index: int = ni * n_cols + nj
+                counts[index] += change
+                if change < 0 and rolls[index] and counts[index] == 3:
+                    exposed.append((ni, nj))
+
+        return exposed
+
+    def has_roll(self, i: int, j: int) -> bool:
+        """Whether there is a paper roll at position (i, j)."""
+        return self.rolls[i * self.n_cols + j] == 1
+
+    def neighbour_count(self, i: int, j: int) -> int:
+        """The number of paper rolls adjacent to position (i, j)."""
+        return self.counts[i * self.n_cols + j]
+
+    def is_accessible(self, i: int, j: int) -> bool:
+        """Whether there is a paper roll at position (i, j) which can be accessed by a forklift."""
+        index: int = i * self.n_cols + j
+        return self.rolls[index] == 1 and self.counts[index] < 4
+
+    def add_roll(self, i: int, j: int) -> None:
+        """
+        Adds a paper roll at position (i, j), if there is none.
+
+        Parameters
+        ----------
+        i : int
+            The row of the position.
+        j : int
+            The column of the position.
+        """
+        if not self.has_roll(i, j):
+            self.rolls[i * self.n_cols + j] = 1
+            self._update_neighbours(i, j, 1)
+
+    def remove_roll(self, i: int, j: int) -> list[tuple[int, int]]:
+        """
+        Removes the paper roll at position (i, j), if there is one.
+
+        Parameters
+        ----------
+        i : int
+            The row of the position.
+        j : int
+            The column of the position.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The adjacent paper rolls which have just become
+            accessible because of this removal.
+        """
+        index: int = i * self.n_cols + j
+        if not self.rolls[index]:
+            return []
+        self.rolls[index] = 0
+        return self._update_neighbours(i, j, -1)
+
+    def accessible_positions(self) -> list[tuple[int, int]]:
+        """
+        Determines the positions of all paper rolls which can
+        be accessed by a forklift.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            The positions of the accessible paper rolls.
+        """
+        n_cols: int = self.n_cols
+        rolls: bytearray = self.rolls
+        counts: bytearray = self.counts
+        return [divmod(index, n_cols) for index in range(len(rolls)) if rolls[index] and counts[index] < 4]
+
+
+# ----- Part 1 ----- #
+
+
+def solve_part1(inputs: list[str]) -> int:
+    """
+    Solves part 1. Determines from the complete input
+    how many rolls of paper can be accessed by a forklift.
+    This is done by loading the input in a `Grid`, which
+    counts the rolls of paper (@) in the eight adjacent
+    positions of each position.
 
     Parameters
     ----------
@@ -235,46 +413,7 @@ def solve_part1(inputs: list[str]) -> int:
         The number of rolls of paper that can be accessed
         by a forklift.
     """
-    reachable_rolls: int = 0
-
-    n_rows: int = len(inputs)
-    n_cols: int = len(inputs[0])
-
-    # We need to be careful that Python list indexing does
-    # a looparound when using negative indices.
-    for i in range(n_rows):
-        for j in range(n_cols):
-            # Move on if position (i, j) is not a paper roll
-            if inputs[i][j] != "@":
-                continue
-
-            # Count the number of adjacent paper rolls
-            adjacent_rolls: int = 0
-            for i_inc in [-1, 0, 1]:
-                for j_inc in [-1, 0, 1]:
-                    # Skip the position itself
-                    if i_inc == 0 and j_inc == 0:
-                        continue
-
-                    ni: int = i + i_inc
-                    nj: int = j + j_inc
-
-                    # Check for out of bounds
-                    if ni < 0 or ni >= n_rows:
-                        continue
-                    if nj < 0 or nj >= n_cols:
-                        continue
-
-                    # Count adjacent paper roll
-                    if inputs[ni][nj] == "@":
-                        adjacent_rolls += 1
-
-            # Check if the roll is reachable
-            if adjacent_rolls < 4:
-                reachable_rolls += 1
-                # print(i, j)  # so we can check on the example
-
-    return reachable_rolls
+    return len(Grid.from_lines(inputs).accessible_positions())
 
 
 # ----- Part 2 ----- #
@@ -287,25 +426,6 @@ def reacheable_rolls(inputs: list[str]) -> list[tuple[int, int]]:
     be accessed. The positions are then returned. This is used
     to solve a single step in part 2.
 
-    Note
-    ----
-    We denote i the index along the vertical axis (rows)
-    and j the index along the horizontal axis (columns).
-    Inspecting for a position at indices (i, j) requires
-    checking the following relative positions:
-        - (i-1, j-1) : top left
-        - (i-1, j)   : top
-        - (i-1, j+1) : top right
-        - (i, j-1)   : left
-        - (i, j+1)   : right
-        - (i+1, j-1) : bottom left
-        - (i+1, j)   : bottom
-        - (i+1, j+1) : bottom right
-
-    If any of these positions are out of bounds, then they
-    are simply ignored. Naturally, a position is not checked
-    if it does not contain a roll of paper (@).
-
     Parameters
     ----------
     inputs : list[str]
@@ -317,62 +437,66 @@ def reacheable_rolls(inputs: list[str]) -> list[tuple[int, int]]:
         The positions of all paper rolls which can be accessed
         by a forklift.
     """
-    acessible_positions: list[tuple[int, int]] = []
+    return Grid.from_lines(inputs).accessible_positions()
 
-    n_rows: int = len(inputs)
-    n_cols: int = len(inputs[0])
 
-    # We need to be careful that Python list indexing does
-    # a looparound when using negative indices.
-    for i in range(n_rows):
-        for j in range(n_cols):
-            # Move on if position (i, j) is not a paper roll
-            if inputs[i][j] != "@":
-                continue
+def solve_part2(inputs: list[str]) -> int:
+    """
+    Solves part 2. Determines from the complete input
+    how many rolls of paper can be removed by a forklift
+    before no more rolls are accessible.
 
-            # Count the number of adjacent paper rolls
-            adjacent_rolls: int = 0
-            for i_inc in [-1, 0, 1]:
-                for j_inc in [-1, 0, 1]:
-                    # Skip the position itself
-                    if i_inc == 0 and j_inc == 0:
-                        continue
+    Note
+    ----
+    Instead of rescanning the whole grid after each round
+    of removals, we load it in a `Grid` which maintains the
+    neighbour counts, and keep a worklist of accessible rolls.
+    Removing a roll only lowers the counts of its neighbours,
+    so these are the only positions which can become accessible
+    and need to be checked again. Each roll is removed at most
+    once, so the total work is proportional to the grid size.
+
+    Rolls only ever become more accessible as others are
+    removed, so the removal order does not matter and the
+    result is that of the round-by-round removal (which is
+    kept in `solve_part2_rounds`).
 
-                    ni: int = i + i_inc
-                    nj: int = j + j_inc
+    Parameters
+    ----------
+    inputs : list[str]
+        The input lines representing the grid.
 
-                    # Check for out of bounds
-                    if ni < 0 or ni >= n_rows:
-                        continue
-                    if nj < 0 or nj >= n_cols:
-                        continue
+    Returns
+    -------
+    int
+        The number of rolls that can be removed before no
+        more rolls are accessible by a forklift.
+    """
+    grid: Grid = Grid.from_lines(inputs)
+    removed_rolls: int = 0
 
-                    # Count adjacent paper roll
-                    if inputs[ni][nj] == "@":
-                        adjacent_rolls += 1
+    # Start with the rolls accessible in the original grid
+    worklist: deque[tuple[int, int]] = deque(grid.accessible_positions())
 
-            # Check if the roll is reachable
-            if adjacent_rolls < 4:
-                # print(i, j)  # so we can check on the example
-                acessible_positions.append((i, j))
+    # A roll is queued once: when a removal makes its count drop below 4
+    while worklist:
+        i, j = worklist.popleft()
+        worklist.extend(grid.remove_roll(i, j))
+        removed_rolls += 1
 
-    return acessible_positions
+    return removed_rolls
 
 
-def solve_part2(inputs: list[str]) -> int:
+def solve_part2_rounds(inputs: list[str]) -> int:
     """
-    Solves part 2. Determines from the complete input
-    how many rolls of paper can be removed by a forklift
-    before no more rolls are accessible.
-
-    Note
-    ----
-    This is done by iterating as done in part 1 over the
-    input grid to determine which rolls can be accessed
-    by a forklift and storing these positions. After a
-    pass, the stored positions are modified in the input
-    to not contain a roll anymore and a new pass is done.
-    This repeats until no more rolls can be accessed.
+    Original round-by-round version of `solve_part2`, kept
+    as a reference. This is done by iterating as done in
+    part 1 over the input grid to determine which rolls
+    can be accessed by a forklift and storing these
+    positions. After a pass, the stored positions are
+    modified in the input to not contain a roll anymore
+    and a new pass is done. This repeats until no more
+    rolls can be accessed.
 
     Parameters
     ----------
@@ -420,6 +544,532 @@ def solve_part2(inputs: list[str]) -> int:
     return removable_rolls
 
 
+# ----- Vectorized ----- #
+
+
+def load_grid(inputs: list[str]) -> np.ndarray:
+    """
+    Converts the input lines into a boolean array telling
+    where the paper rolls (@) are.
+
+    Parameters
+    ----------
+    inputs : list[str]
+        The input lines representing the grid.
+
+    Returns
+    -------
+    np.ndarray
+        A (rows, columns) boolean array, True for paper rolls.
+    """
+    characters: np.ndarray = np.frombuffer("".join(inputs).encode("ascii"), dtype=np.uint8)
+    return (characters == ord("@")).reshape(len(inputs), len(inputs[0]))
+
+
+def neighbour_counts_array(rolls: np.ndarray) -> np.ndarray:
+    """
+    Vectorized neighbour counting (see `Grid`). The grid is
+    padded with a border of empty positions, so that the
+    counts are the sum of the eight shifted views of the
+    padded grid (one per direction) with no bounds checks.
+
+    Parameters
+    ----------
+    rolls : np.ndarray
+        A (rows, columns) boolean array, True for paper rolls.
+
+    Returns
+    -------
+    np.ndarray
+        The number of adjacent paper rolls at each position.
+    """
+    n_rows, n_cols = rolls.shape
+    padded: np.ndarray = np.pad(rolls, 1).view(np.uint8)
+    counts: np.ndarray = np.zeros((n_rows, n_cols), dtype=np.uint8)
+
+    for i_inc in (-1, 0, 1):
+        for j_inc in (-1, 0, 1):
+            if i_inc == 0 and j_inc == 0:
+                continue
+            counts += padded[1 + i_inc : 1 + i_inc + n_rows, 1 + j_inc : 1 + j_inc + n_cols]
+
+    return counts
+
+
+def accessible_mask(rolls: np.ndarray) -> np.ndarray:
+    """
+    Determines in one shot all the paper rolls which can be
+    accessed by a forklift: those with less than 4 adjacent
+    paper rolls.
+
+    Parameters
+    ----------
+    rolls : np.ndarray
+        A (rows, columns) boolean array, True for paper rolls.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean array, True for accessible paper rolls.
+    """
+    return rolls & (neighbour_counts_array(rolls) < 4)
+
+
+def solve_part1_vectorized(inputs: list[str]) -> int:
+    """
+    Solves part 1 like `solve_part1`, with the vectorized
+    neighbour counting.
+
+    Parameters
+    ----------
+    inputs : list[str]
+        The input lines representing the grid.
+
+    Returns
+    -------
+    int
+        The number of rolls of paper that can be accessed
+        by a forklift.
+    """
+    return int(accessible_mask(load_grid(inputs)).sum())
+
+
+def solve_part2_vectorized(inputs: list[str]) -> int:
+    """
+    Solves part 2 like `solve_part2_rounds`, with the vectorized
+    neighbour counting: each round removes all the accessible
+    rolls at once from the boolean grid.
+
+    Parameters
+    ----------
+    inputs : list[str]
+        The input lines representing the grid.
+
+    Returns
+    -------
+    int
+        The number of rolls that can be removed before no
+        more rolls are accessible by a forklift.
+    """
+    return remove_accessible(load_grid(inputs))
+
+
+# ----- Bitboards ----- #
+
+
+class BitGrid:
+    """
+    Compact grid of paper rolls in which each row is stored
+    as a single (arbitrarily large) Python integer, with bit
+    j set when there is a paper roll in column j. This takes
+    one bit per position, and all positions of a row are
+    handled at once by bitwise operations.
+
+    Parameters
+    ----------
+    rows : list[int]
+        The bitmask of paper rolls in each row.
+    n_cols : int
+        The number of columns of the grid.
+    """
+
+    __slots__ = ("rows", "n_cols")
+
+    def __init__(self, rows: list[int], n_cols: int) -> None:
+        self.rows: list[int] = rows
+        self.n_cols: int = n_cols
+
+    @classmethod
+    def from_lines(cls, inputs: list[str]) -> BitGrid:
+        """
+        Builds the grid from the input lines.
+
+        Parameters
+        ----------
+        inputs : list[str]
+            The input lines representing the grid.
+
+        Returns
+        -------
+        BitGrid
+            The grid of paper rolls.
+        """
+        # Column j is bit j, so the line is reversed to read it as a binary number
+        table = str.maketrans("@.", "10")
+        rows: list[int] = [int(line[::-1].translate(table), 2) for line in inputs]
+        return cls(rows, len(inputs[0]))
+
+    def count(self) -> int:
+        """The number of paper rolls in the grid."""
+        return sum(row.bit_count() for row in self.rows)
+
+    def accessible_rows(self) -> list[int]:
+        """
+        Determines the paper rolls which can be accessed by a
+        forklift, as one bitmask per row.
+
+        Note
+        ----
+        The eight neighbours of a row are the rows above and
+        below it, shifted by one column either way or not at
+        all, and the row itself shifted either way. These are
+        added with a bit-sliced adder: four bitmasks hold the
+        bits of the neighbour count of every position in the
+        row (the count goes up to 8). A roll is accessible if
+        its count is below 4, that is if neither of the bits
+        of value 4 and 8 is set.
+
+        Returns
+        -------
+        list[int]
+            The bitmask of accessible paper rolls in each row.
+        """
+        full: int = (1 << self.n_cols) - 1
+        padded: list[int] = [0, *self.rows, 0]
+        accessible: list[int] = []
+
+        for i, row in enumerate(self.rows, start=1):
+            above, below = padded[i - 1], padded[i + 1]
+            neighbours = (
+                above,
+                (above << 1) & full,
+                above >> 1,
+                (row << 1) & full,
+                row >> 1,
+                below,
+                (below << 1) & full,
+                below >> 1,
+            )
+
+            # Bit-sliced addition of the eight neighbour bitmasks
+            counts: list[int] = [0, 0, 0, 0]
+            for carry in neighbours:
+                for bit in range(4):
+                    counts[bit], carry = counts[bit] ^ carry, counts[bit] & carry
+                    if not carry:
+                        break
+
+            accessible.append(row & ~(counts[2] | counts[3]))
+
+        return accessible
+
+    def remove(self, masks: list[int]) -> None:
+        """
+        Removes paper rolls from the grid.
+
+        Parameters
+        ----------
+        masks : list[int]
+            The bitmask of paper rolls to remove in each row.
+        """
+        self.rows = [row & ~mask for row, mask in zip(self.rows, masks)]
+
+
+def solve_part1_bitboard(inputs: list[str]) -> int:
+    """
+    Solves part 1 like `solve_part1`, using a `BitGrid`.
+
+    Parameters
+    ----------
+    inputs : list[str]
+        The input lines representing the grid.
+
+    Returns
+    -------
+    int
+        The number of rolls of paper that can be accessed
+        by a forklift.
+    """
+    grid: BitGrid = BitGrid.from_lines(inputs)
+    return sum(mask.bit_count() for mask in grid.accessible_rows())
+
+
+def solve_part2_bitboard(inputs: list[str]) -> int:
+    """
+    Solves part 2 like `solve_part2_rounds`, using a `BitGrid`:
+    each round removes all the accessible rolls at once.
+
+    Parameters
+    ----------
+    inputs : list[str]
+        The input lines representing the grid.
+
+    Returns
+    -------
+    int
+        The number of rolls that can be removed before no
+        more rolls are accessible by a forklift.
+    """
+    grid: BitGrid = BitGrid.from_lines(inputs)
+    initial_rolls: int = grid.count()
+
+    while any(accessible := grid.accessible_rows()):
+        grid.remove(accessible)
+
+    return initial_rolls - grid.count()
+
+
+# ----- Parallel ----- #
+
+
+def split_bands(n_rows: int, n_bands: int) -> list[tuple[int, int]]:
+    """
+    Splits the rows of a grid into (at most) the given number
+    of bands of consecutive rows, of about equal sizes.
+
+    Parameters
+    ----------
+    n_rows : int
+        The number of rows of the grid.
+    n_bands : int
+        The number of bands wanted.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The bands, as (first row, last row excluded).
+    """
+    boundaries: list[int] = [n_rows * band // n_bands for band in range(n_bands + 1)]
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def band_accessible(
+    rolls_name: str, accessible_name: str, shape: tuple[int, int], start: int, end: int
+) -> int:
+    """
+    Determines the accessible paper rolls in a band of rows of
+    a grid held in shared memory, and writes them to the shared
+    accessible mask. The band is read along with a halo of one
+    row on either side, so that the counts of its edge rows
+    take the adjacent bands into account.
+
+    Parameters
+    ----------
+    rolls_name : str
+        The name of the shared memory holding the grid of rolls.
+    accessible_name : str
+        The name of the shared memory holding the accessible mask.
+    shape : tuple[int, int]
+        The shape of the grid.
+    start : int
+        The first row of the band.
+    end : int
+        The row after the last one of the band.
+
+    Returns
+    -------
+    int
+        The number of accessible paper rolls in the band.
+    """
+    rolls_memory = SharedMemory(name=rolls_name)
+    accessible_memory = SharedMemory(name=accessible_name)
+    rolls: np.ndarray | None = None
+    accessible: np.ndarray | None = None
+    try:
+        rolls = np.ndarray(shape, dtype=bool, buffer=rolls_memory.buf)
+        accessible = np.ndarray(shape, dtype=bool, buffer=accessible_memory.buf)
+
+        # Compute on a copy of the band and its halo rows, so that no view on the
+        # shared memory is held by other frames if it raises, and only keep the band
+        halo_start, halo_end = max(start - 1, 0), min(end + 1, shape[0])
+        halo_band: np.ndarray = rolls[halo_start:halo_end].copy()
+        band: np.ndarray = accessible_mask(halo_band)[start - halo_start : end - halo_start]
+        accessible[start:end] = band
+        return int(band.sum())
+    finally:
+        rolls = accessible = None  # the buffers can't be released while still in use
+        rolls_memory.close()
+        accessible_memory.close()
+
+
+def band_remove(rolls_name: str, accessible_name: str, shape: tuple[int, int], start: int, end: int) -> None:
+    """
+    Removes the accessible paper rolls, as given by the shared
+    accessible mask, from a band of rows of a grid held in
+    shared memory.
+
+    Parameters
+    ----------
+    rolls_name : str
+        The name of the shared memory holding the grid of rolls.
+    accessible_name : str
+        The name of the shared memory holding the accessible mask.
+    shape : tuple[int, int]
+        The shape of the grid.
+    start : int
+        The first row of the band.
+    end : int
+        The row after the last one of the band.
+    """
+    rolls_memory = SharedMemory(name=rolls_name)
+    accessible_memory = SharedMemory(name=accessible_name)
+    rolls: np.ndarray | None = None
+    accessible: np.ndarray | None = None
+    try:
+        rolls = np.ndarray(shape, dtype=bool, buffer=rolls_memory.buf)
+        accessible = np.ndarray(shape, dtype=bool, buffer=accessible_memory.buf)
+        rolls[start:end] &= ~accessible[start:end]
+    finally:
+        rolls = accessible = None  # the buffers can't be released while still in use
+        rolls_memory.close()
+        accessible_memory.close()
+
+
+def solve_parallel(inputs: list[str], part: int, max_workers: int | None = None) -> int:
+    """
+    Solves either part of the puzzle with a pool of worker
+    processes, each handling a band of rows of the grid. The
+    grid and the mask of accessible rolls live in shared memory,
+    so no part of the grid is ever sent to the workers.
+
+    Note
+    ----
+    For part 2, each round is done in two steps: all workers
+    first determine the accessible rolls of their band (reading
+    the halo rows of the adjacent bands), and only once they
+    are all done do they remove these rolls from their band.
+    This way no band sees its halo change during a round, and
+    the halos are in sync for the next round.
+
+    Parameters
+    ----------
+    inputs : list[str]
+        The input lines representing the grid.
+    part : int
+        The part of the puzzle to solve, 1 or 2.
+    max_workers : int, optional
+        The number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    int
+        The answer to the given part of the puzzle.
+    """
+    grid: np.ndarray = load_grid(inputs)
+    n_workers: int = max_workers or os.cpu_count() or 1
+    bands: list[tuple[int, int]] = split_bands(grid.shape[0], n_workers)
+    rolls_memory = SharedMemory(create=True, size=max(grid.nbytes, 1))
+    accessible_memory = SharedMemory(create=True, size=max(grid.nbytes, 1))
+
+    try:
+        np.ndarray(grid.shape, dtype=bool, buffer=rolls_memory.buf)[:] = grid
+        arguments = (
+            [rolls_memory.name] * len(bands),
+            [accessible_memory.name] * len(bands),
+            [grid.shape] * len(bands),
+            [start for start, _ in bands],
+            [end for _, end in bands],
+        )
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            removable_rolls: int = 0
+            while n_accessible := sum(executor.map(band_accessible, *arguments)):
+                removable_rolls += n_accessible
+                if part == 1:
+                    break
+                list(executor.map(band_remove, *arguments))  # wait for all bands
+        return removable_rolls
+
+    finally:
+        rolls_memory.close()
+        rolls_memory.unlink()
+        accessible_memory.close()
+        accessible_memory.unlink()
+
+
+# ----- Memory-Mapped ----- #
+
+
+def map_grid(path: Path, writable: bool = False) -> np.ndarray:
+    """
+    Memory-maps an input file as a 2D array of its bytes, one
+    row per line, without reading or copying anything. Each row
+    is followed by a newline in the file, which the array skips
+    by using a row stride of the width plus one.
+
+    Note
+    ----
+    A writable grid is mapped copy-on-write: rolls can be removed
+    from it, which only copies the modified pages in memory and
+    never changes the file. Lines must end with a single newline
+    character.
+
+    Parameters
+    ----------
+    path : Path
+        The input file representing the grid.
+    writable : bool
+        Whether the grid can be modified. Defaults to False.
+
+    Returns
+    -------
+    np.ndarray
+        A (rows, columns) uint8 view on the characters of the grid.
+    """
+    # An empty file can not be memory-mapped, but then there is no grid
+    if path.stat().st_size == 0:
+        return np.empty((0, 0), dtype=np.uint8)
+
+    with path.open("rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_COPY if writable else mmap.ACCESS_READ)
+
+    # The last line may or may not end with a newline
+    width: int = mapped.find(b"\n")
+    width = len(mapped) if width == -1 else width
+    n_rows: int = (len(mapped) + 1) // (width + 1)
+
+    return np.ndarray((n_rows, width), dtype=np.uint8, buffer=mapped, strides=(width + 1, 1), order="C")
+
+
+def remove_accessible(rolls: np.ndarray) -> int:
+    """
+    Removes, in place and round by round, the accessible paper
+    rolls from a boolean grid until none is accessible anymore.
+
+    Parameters
+    ----------
+    rolls : np.ndarray
+        A (rows, columns) boolean array, True for paper rolls.
+
+    Returns
+    -------
+    int
+        The number of rolls that were removed.
+    """
+    removable_rolls: int = 0
+
+    while (accessible := accessible_mask(rolls)).any():
+        removable_rolls += int(accessible.sum())
+        rolls &= ~accessible
+
+    return removable_rolls
+
+
+def solve_mapped(path: Path, part: int) -> int:
+    """
+    Solves either part of the puzzle from a memory-mapped input
+    file (see `map_grid`). The only copy of the grid is the one
+    boolean array of paper rolls which the rounds of part 2
+    remove rolls from.
+
+    Parameters
+    ----------
+    path : Path
+        The input file representing the grid.
+    part : int
+        The part of the puzzle to solve, 1 or 2.
+
+    Returns
+    -------
+    int
+        The answer to the given part of the puzzle.
+    """
+    rolls: np.ndarray = map_grid(path) == ord("@")
+    if part == 1:
+        return int(accessible_mask(rolls).sum())
+    return remove_accessible(rolls)
+
+
 # ----- Running ----- #
 
 if __name__ == "__main__":